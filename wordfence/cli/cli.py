@@ -92,12 +92,10 @@ class WordfenceCli:
         log.setLevel(logging.INFO)
 
     def _get_cacheable_types(self) -> Set[str]:
-        cacheable_types = set()
-        cacheable_types.update(licensing.CACHEABLE_TYPES)
-        cacheable_types.update(terms_management.CACHEABLE_TYPES)
-        for definition in self.subcommand_definitions.values():
-            cacheable_types.update(definition.cacheable_types)
-        return cacheable_types
+        return self.subcommand_definitions.cacheable_types.union(
+                licensing.CACHEABLE_TYPES,
+                terms_management.CACHEABLE_TYPES
+            )
 
     def display_help(self) -> None:
         self.helper.display_help(self.config.subcommand)
@@ -2,7 +2,7 @@ import argparse
 import json
 import os
 from argparse import ArgumentParser, Namespace
-from typing import Set, List, Dict, Any, Tuple
+from typing import Set, List, Dict, Any, Tuple, Optional, Iterable
 
 from wordfence.logging import log
 from ..helper import Helper
@@ -146,6 +146,41 @@ def add_definitions_to_parser(
         add_to_parser(parser, definition)
 
 
+class SubcommandPeekException(Exception):
+    pass
+
+
+class SubcommandPeekParser(ArgumentParser):
+
+    def error(self, message: str) -> None:
+        raise SubcommandPeekException(message)
+
+
+def peek_subcommand() -> Optional[str]:
+    parser = SubcommandPeekParser(add_help=False)
+    add_definitions_to_parser(parser, base_config_map)
+    parser.add_argument('subcommand', nargs='?')
+    cli_values, _trailing_arguments = parser.parse_known_args()
+    return cli_values.subcommand
+
+
+def get_parsed_subcommand_definitions(
+            subcommand_definitions: Dict[str, SubcommandDefinition]
+        ) -> Iterable[SubcommandDefinition]:
+    # Only the requested subcommand needs a fully populated parser, all
+    # definitions are loaded if it cannot be determined up front so that
+    # renamed and invalid subcommands are still reported as before
+    try:
+        subcommand = peek_subcommand()
+    except SubcommandPeekException:
+        return subcommand_definitions.values()
+    if subcommand is None:
+        return []
+    if subcommand in subcommand_definitions:
+        return [subcommand_definitions[subcommand]]
+    return subcommand_definitions.values()
+
+
 def get_cli_values(
             subcommand_definitions: Dict[str, SubcommandDefinition],
             helper: Helper
@@ -162,7 +197,9 @@ def get_cli_values(
     subparsers = parser.add_subparsers(title="Available Subcommands",
                                        dest="subcommand",
                                        metavar='')
-    for subcommand_definition in subcommand_definitions.values():
+    for subcommand_definition in get_parsed_subcommand_definitions(
+                subcommand_definitions
+            ):
         definitions = subcommand_definition.get_config_map()
         subparser = subparsers.add_parser(
                 subcommand_definition.name,
@@ -1,10 +1,10 @@
 import sys
-from typing import Optional, Any, Callable, Set, Union
+from typing import Optional, Any, Callable, Set, Union, TYPE_CHECKING
 
 from ..version import __version__, __version_name__
 from ..util import pcre, vectorscan
 from ..util.text import yes_no
-from ..api import noc1, intelligence
+from ..api import noc1
 from ..util.caching import Cache, CacheDirectory, RuntimeCache, \
         InvalidCachedValueException, CacheException
 from ..util.input import has_terminal_input, has_terminal_output
@@ -15,6 +15,9 @@ from ..logging import log, LogLevel, LogSettings
 from .config.config import Config
 from .email import Mailer
 
+if TYPE_CHECKING:
+    from ..api import intelligence
+
 
 class CliContext:
 
@@ -145,8 +148,11 @@ class CliContext:
                 )
         return self._noc1_client
 
-    def get_wfi_client(self) -> intelligence.Client:
+    def get_wfi_client(self) -> 'intelligence.Client':
         if self._wfi_client is None:
+            # The client pulls in the vulnerability models, which most
+            # subcommands never use
+            from ..api import intelligence
             self._wfi_client = intelligence.Client(
                     self.config.wfi_url
                 )
@@ -1,4 +1,7 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+
 from ...wordpress.site import WordpressLocator
 from ...logging import log
 from ..subcommands import Subcommand
@@ -6,40 +9,63 @@ from ..io import IoManager
 from ..exceptions import ConfigurationException
 
 
+MAX_WORKERS = 32
+
+
+def get_default_worker_count() -> int:
+    # Locating sites is IO bound, so more threads than CPUs are useful
+    return min(MAX_WORKERS, (os.cpu_count() or 1) * 4)
+
+
 class CountSitesSubcommand(Subcommand):
 
     def count_sites(self, path: bytes) -> int:
-        count = 0
         locator = WordpressLocator(
                     path=path,
                     allow_nested=self.config.allow_nested,
                     allow_io_errors=self.config.allow_io_errors
                 )
+        count = 0
         for core in locator.locate_core_paths():
             log.debug('Located WordPress site at ' + os.fsdecode(core))
             count += 1
         return count
 
-    def invoke(self) -> int:
+    def count_all_sites(self, paths: List[bytes]) -> int:
+        if len(paths) < 2:
+            return sum(self.count_sites(path) for path in paths)
         count = 0
-        paths_counted = 0
+        with ThreadPoolExecutor(
+                    min(get_default_worker_count(), len(paths))
+                ) as executor:
+            futures = [
+                    executor.submit(self.count_sites, path) for path in paths
+                ]
+            try:
+                for future in as_completed(futures):
+                    count += future.result()
+            except BaseException:
+                # Stop at the first failure rather than finishing every walk
+                for future in futures:
+                    future.cancel()
+                raise
+        return count
+
+    def invoke(self) -> int:
         io_manager = IoManager(
                 self.config.read_stdin,
                 self.config.path_separator,
                 binary=True
             )
-        for path in self.config.trailing_arguments:
-            count += self.count_sites(path)
-            paths_counted += 1
+        paths = list(self.config.trailing_arguments)
         if io_manager.should_read_stdin():
-            for path in io_manager.get_input_reader().read_all_entries():
-                count += self.count_sites(path)
-                paths_counted += 1
+            paths.extend(io_manager.get_input_reader().read_all_entries())
         if self.context.requires_input(self.config.require_path) \
-                and paths_counted == 0:
+                and len(paths) == 0:
             raise ConfigurationException(
                     'At least one path must be specified'
                 )
+        count = self.count_all_sites(paths)
         log.info(f'Located {count} WordPress site(s)')
         print(count)
         return 0
@@ -9,6 +9,7 @@ from .context import CliContext
 
 CACHE_KEY = 'license'
 CACHEABLE_TYPES = {
+        'wordfence.api.licensing.License',
         'wordfence.api.licensing.LicenseSpecific'
     }
 
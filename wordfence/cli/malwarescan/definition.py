@@ -3,7 +3,8 @@ from wordfence.util.pcre import PCRE_DEFAULT_MATCH_LIMIT, \
 from wordfence.util.units import byte_length
 
 from ...scanning.matching import MatchEngine
-from ..subcommands import SubcommandDefinition, UsageExample
+from ..subcommands import SubcommandDefinition, UsageExample, \
+        get_subcommand_cacheable_types
 from ..config.typing import ConfigDefinitions
 from .reporting import SCAN_REPORT_CONFIG_OPTIONS
 
@@ -265,13 +266,7 @@ config_definitions: ConfigDefinitions = {
 }
 
 
-cacheable_types = {
-    'wordfence.intel.signatures.SignatureSet',
-    'wordfence.intel.signatures.CommonString',
-    'wordfence.intel.signatures.Signature',
-    'wordfence.intel.signatures.PrecompiledSignatureSet',
-    'wordfence.api.licensing.License'
-}
+cacheable_types = get_subcommand_cacheable_types('malware-scan')
 
 examples = [
     UsageExample(
@@ -1,14 +1,15 @@
 import importlib
 from collections import namedtuple
 from types import ModuleType
-from typing import Optional, Dict, Set, List
+from typing import Optional, Dict, Set, FrozenSet, List, Mapping, Iterable, \
+        Iterator, Callable
 
 from .config.typing import ConfigDefinitions
 from .config.config_items import config_definitions_to_config_map, \
         ConfigItemDefinition
 from .context import CliContext
 
-VALID_SUBCOMMANDS = {
+VALID_SUBCOMMANDS = frozenset({
         'configure',
         'malware-scan',
         'vuln-scan',
@@ -17,9 +18,39 @@ VALID_SUBCOMMANDS = {
         'help',
         'version',
         'terms'
+    })
+
+# The types each subcommand stores in the cache are declared here, rather than
+# only on the definitions, so that the cache allow list can be built without
+# importing every subcommand
+SUBCOMMAND_CACHEABLE_TYPES: Dict[str, FrozenSet[str]] = {
+        'malware-scan': frozenset({
+            'wordfence.intel.signatures.SignatureSet',
+            'wordfence.intel.signatures.CommonString',
+            'wordfence.intel.signatures.Signature',
+            'wordfence.intel.signatures.PrecompiledSignatureSet',
+            'wordfence.api.licensing.License'
+        }),
+        'vuln-scan': frozenset({
+            'wordfence.intel.vulnerabilities.VulnerabilityIndex',
+            'wordfence.intel.vulnerabilities.ScannerVulnerability',
+            'wordfence.intel.vulnerabilities.ProductionVulnerability',
+            'wordfence.intel.vulnerabilities.Software',
+            'wordfence.intel.vulnerabilities.ProductionSoftware',
+            'wordfence.intel.vulnerabilities.SoftwareType',
+            'wordfence.intel.vulnerabilities.VersionRange',
+            'wordfence.intel.vulnerabilities.CopyrightInformation',
+            'wordfence.intel.vulnerabilities.Copyright',
+            'wordfence.intel.vulnerabilities.Cwe',
+            'wordfence.intel.vulnerabilities.Cvss'
+        })
     }
 
 
+def get_subcommand_cacheable_types(subcommand: str) -> FrozenSet[str]:
+    return SUBCOMMAND_CACHEABLE_TYPES.get(subcommand, frozenset())
+
+
 def map_subcommand_to_module_name(subcommand: str) -> str:
     return subcommand.replace('-', '')
 
@@ -100,6 +131,7 @@ class SubcommandDefinition:
         self.accepts_files = accepts_files
         self.accepts_directories = accepts_directories
         self.long_description = long_description
+        self._factory: Optional[Callable[[CliContext], Subcommand]] = None
 
     def get_config_map(self) -> Dict[str, ConfigItemDefinition]:
         if self.config_map is None:
@@ -114,11 +146,16 @@ class SubcommandDefinition:
     def accepts_paths(self) -> bool:
         return self.accepts_files or self.accepts_directories
 
+    def _get_factory(self) -> Callable[[CliContext], Subcommand]:
+        if self._factory is None:
+            module = import_subcommand_module(self.name)
+            assert hasattr(module, 'factory')
+            assert callable(module.factory)
+            self._factory = module.factory
+        return self._factory
+
     def initialize_subcommand(self, context: CliContext) -> Subcommand:
-        module = import_subcommand_module(self.name)
-        assert hasattr(module, 'factory')
-        assert callable(module.factory)
-        subcommand = module.factory(context)
+        subcommand = self._get_factory()(context)
         assert isinstance(subcommand, Subcommand)
         return subcommand
 
@@ -130,8 +167,42 @@ def load_subcommand_definition(subcommand: str) -> SubcommandDefinition:
     return module.definition
 
 
-def load_subcommand_definitions() -> Dict[str, SubcommandDefinition]:
-    definitions = dict()
-    for subcommand in VALID_SUBCOMMANDS:
-        definitions[subcommand] = load_subcommand_definition(subcommand)
-    return definitions
+class SubcommandDefinitions(Mapping[str, SubcommandDefinition]):
+
+    # Definitions are only imported when they are first accessed so that
+    # invoking a single subcommand does not require loading all of them
+    def __init__(self, names: Iterable[str] = VALID_SUBCOMMANDS):
+        self.names = frozenset(names)
+        self._definitions: Dict[str, SubcommandDefinition] = {}
+        self._cacheable_types: Optional[FrozenSet[str]] = None
+
+    @property
+    def cacheable_types(self) -> FrozenSet[str]:
+        if self._cacheable_types is None:
+            cacheable_types = set()
+            for name in self.names:
+                cacheable_types.update(get_subcommand_cacheable_types(name))
+            self._cacheable_types = frozenset(cacheable_types)
+        return self._cacheable_types
+
+    def __getitem__(self, name: str) -> SubcommandDefinition:
+        definition = self._definitions.get(name)
+        if definition is None:
+            if name not in self.names:
+                raise KeyError(name)
+            definition = load_subcommand_definition(name)
+            self._definitions[name] = definition
+        return definition
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def load_subcommand_definitions() -> SubcommandDefinitions:
+    return SubcommandDefinitions()
@@ -1,4 +1,5 @@
-from ..subcommands import SubcommandDefinition, UsageExample
+from ..subcommands import SubcommandDefinition, UsageExample, \
+        get_subcommand_cacheable_types
 from ..config.typing import ConfigDefinitions
 from ...api.intelligence import VulnerabilityFeedVariant
 from .reporting import VULN_SCAN_REPORT_CONFIG_OPTIONS
@@ -165,19 +166,7 @@ config_definitions: ConfigDefinitions = {
     }
 }
 
-cacheable_types = {
-    'wordfence.intel.vulnerabilities.VulnerabilityIndex',
-    'wordfence.intel.vulnerabilities.ScannerVulnerability',
-    'wordfence.intel.vulnerabilities.ProductionVulnerability',
-    'wordfence.intel.vulnerabilities.Software',
-    'wordfence.intel.vulnerabilities.ProductionSoftware',
-    'wordfence.intel.vulnerabilities.SoftwareType',
-    'wordfence.intel.vulnerabilities.VersionRange',
-    'wordfence.intel.vulnerabilities.CopyrightInformation',
-    'wordfence.intel.vulnerabilities.Copyright',
-    'wordfence.intel.vulnerabilities.Cwe',
-    'wordfence.intel.vulnerabilities.Cvss'
-}
+cacheable_types = get_subcommand_cacheable_types('vuln-scan')
 
 examples = [
     UsageExample(
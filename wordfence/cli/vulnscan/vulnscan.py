@@ -7,7 +7,8 @@ from ...intel.vulnerabilities import VulnerabilityIndex, \
         VulnerabilityScanner, VulnerabilityFilter, AlreadyScannedException, \
         is_cve_id
 from ...api.intelligence import VulnerabilityFeedVariant
-from ...util.caching import Cacheable, DURATION_ONE_DAY
+from ...util.caching import Cacheable, DURATION_ONE_DAY, \
+        InvalidCachedValueException
 from ...util.versioning import version_to_str
 from ...wordpress.site import WordpressSite, WordpressStructureOptions, \
         WordpressLocator, WordpressException
@@ -29,10 +30,25 @@ class VulnScanSubcommand(Subcommand):
             client = self.context.get_wfi_client()
             vulnerabilities = client.fetch_vulnerability_feed(variant)
             return VulnerabilityIndex(vulnerabilities)
+
+        def filter_vulnerability_index(
+                    index: VulnerabilityIndex
+                ) -> VulnerabilityIndex:
+            if not index.is_supported_version():
+                raise InvalidCachedValueException(
+                        'Unsupported vulnerability index version'
+                    )
+            return index
+        # The index format is part of the key so that indexes cached in
+        # other formats, which may no longer unpickle, are never read
         vulnerability_index = Cacheable(
-                f'vulnerability_index_{variant.path}',
+                f'vulnerability_index_{VulnerabilityIndex.VERSION}_'
+                f'{variant.path}',
                 initialize_vulnerability_index,
-                DURATION_ONE_DAY
+                DURATION_ONE_DAY,
+                filters=[
+                    filter_vulnerability_index
+                ]
             )
         return vulnerability_index.get(self.cache)
 
@@ -0,0 +1,119 @@
+import unittest
+from typing import Dict, List
+
+from .vulnerabilities import VulnerabilityIndex, ScannerVulnerability, \
+        Software, SoftwareType, VersionRange
+
+
+VERSIONS = [
+        '0.9',
+        '1',
+        '1.0',
+        '1.0.0',
+        '1.0.0-dev',
+        '1.0.0.1',
+        '1.5',
+        '2.0-beta',
+        '2.0',
+        '2.0.0',
+        '2.0.1',
+        '3.1pl',
+        '10.0'
+    ]
+
+RANGES = [
+        ('*', True, '*', True),
+        ('*', True, '1.0', False),
+        ('*', False, '2', True),
+        ('1', True, '2.0', True),
+        ('1', False, '2.0', False),
+        ('1.0.0', True, '*', True),
+        ('1.0.0', False, '1.5', True),
+        ('1.0.0-dev', True, '1.0.0', False),
+        ('1.5', True, '1.5', True),
+        ('2.0-beta', True, '2.0.0', True),
+        ('2.0.0', False, '*', False),
+        ('3.1pl', True, '10', False),
+        ('10.0', True, '*', True)
+    ]
+
+
+class TestVulnerabilityIndex(unittest.TestCase):
+
+    def _create_vulnerabilities(self) -> Dict[str, ScannerVulnerability]:
+        vulnerabilities = {}
+        for index, bounds in enumerate(RANGES):
+            identifier = f'vulnerability-{index}'
+            vulnerabilities[identifier] = ScannerVulnerability(
+                    identifier=identifier,
+                    title=identifier,
+                    software=[
+                        Software(
+                            type=SoftwareType.PLUGIN,
+                            name='Example',
+                            slug='example',
+                            affected_versions={
+                                'range': VersionRange(*bounds)
+                            }
+                        )
+                    ]
+                )
+        return vulnerabilities
+
+    def _find_expected(
+                self,
+                vulnerabilities: Dict[str, ScannerVulnerability],
+                version: bytes
+            ) -> List[str]:
+        expected = []
+        for identifier, vulnerability in vulnerabilities.items():
+            for software in vulnerability.software:
+                for affected in software.affected_versions.values():
+                    if affected.includes(version):
+                        expected.append(identifier)
+        return sorted(expected)
+
+    def test_get_vulnerabilities(self):
+        vulnerabilities = self._create_vulnerabilities()
+        index = VulnerabilityIndex(vulnerabilities)
+        for version in VERSIONS:
+            version = version.encode()
+            with self.subTest(version=version):
+                self.assertEqual(
+                        sorted(index.get_vulnerabilities(
+                            SoftwareType.PLUGIN,
+                            'example',
+                            version
+                        )),
+                        self._find_expected(vulnerabilities, version)
+                    )
+
+    def test_bounds(self):
+        index = VulnerabilityIndex(self._create_vulnerabilities())
+
+        def get_identifiers(version: bytes) -> List[str]:
+            return sorted(index.get_plugin_vulnerabilities('example', version))
+
+        self.assertIn('vulnerability-0', get_identifiers(b'0.1'))
+        self.assertNotIn('vulnerability-4', get_identifiers(b'1'))
+        self.assertNotIn('vulnerability-4', get_identifiers(b'1.0.0'))
+        self.assertIn('vulnerability-4', get_identifiers(b'1.0.0.1'))
+        self.assertIn('vulnerability-3', get_identifiers(b'1.0.0'))
+        self.assertIn('vulnerability-5', get_identifiers(b'1'))
+        self.assertNotIn('vulnerability-1', get_identifiers(b'1.0.0'))
+        self.assertIn('vulnerability-2', get_identifiers(b'2.0.0'))
+        self.assertEqual(
+                get_identifiers(b'1.5'),
+                get_identifiers(b'1.5.0.0')
+            )
+
+    def test_unknown_software(self):
+        index = VulnerabilityIndex(self._create_vulnerabilities())
+        self.assertEqual(
+                len(index.get_plugin_vulnerabilities('unknown', b'1.0')),
+                0
+            )
+        self.assertEqual(
+                len(index.get_theme_vulnerabilities('example', b'1.0')),
+                0
+            )
@@ -1,10 +1,17 @@
 import re
+import sys
 import os.path
+from collections import defaultdict
+from functools import lru_cache, cmp_to_key
+from itertools import islice
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Union, Set, Callable, Generator
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Union, Set, FrozenSet, \
+        Callable, Generator, Tuple
 
-from ..util.versioning import PhpVersion, compare_php_versions
+from ..util.versioning import PhpVersion, PhpVersionKey, \
+        get_php_version_key, compare_php_version_keys
 from ..util.url import Url
 from ..wordpress.site import WordpressSite
 from ..wordpress.extension import Extension
@@ -14,26 +21,99 @@ from ..wordpress.theme import Theme
 
 VERSION_ANY = '*'
 
+# Slots are only supported by dataclass as of Python 3.10
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def parse_range_bound(version: str) -> Optional[PhpVersionKey]:
+    if version == VERSION_ANY:
+        return None
+    return get_php_version_key(version)
+
+
+RangeBounds = Tuple[
+        Optional[PhpVersionKey],
+        bool,
+        Optional[PhpVersionKey],
+        bool
+    ]
+
+
+def _includes_parsed(
+            from_key: Optional[PhpVersionKey],
+            from_inclusive: bool,
+            to_key: Optional[PhpVersionKey],
+            to_inclusive: bool,
+            version_key: PhpVersionKey
+        ) -> bool:
+    if from_key is not None:
+        from_result = compare_php_version_keys(from_key, version_key)
+        if not (from_result == -1 or (from_inclusive and from_result == 0)):
+            return False
+    if to_key is not None:
+        to_result = compare_php_version_keys(to_key, version_key)
+        if not (to_result == 1 or (to_inclusive and to_result == 0)):
+            return False
+    return True
+
+
+@dataclass(frozen=True, **SLOTS)
 class VersionRange:
     from_version: str
     from_inclusive: bool
     to_version: str
     to_inclusive: bool
+    from_parsed: Optional[PhpVersionKey] = \
+        field(init=False, repr=False, compare=False)
+    to_parsed: Optional[PhpVersionKey] = \
+        field(init=False, repr=False, compare=False)
 
-    def includes(self, version: Union[PhpVersion, str]) -> bool:
-        from_result = compare_php_versions(self.from_version, version)
-        if not (self.from_version == VERSION_ANY or
-                from_result == -1 or
-                (self.from_inclusive and from_result == 0)):
-            return False
-        to_result = compare_php_versions(self.to_version, version)
-        if not (self.to_version == VERSION_ANY or
-                to_result == 1 or
-                (self.to_inclusive and to_result == 0)):
-            return False
-        return True
+    def __post_init__(self):
+        object.__setattr__(
+                self,
+                'from_parsed',
+                parse_range_bound(self.from_version)
+            )
+        object.__setattr__(
+                self,
+                'to_parsed',
+                parse_range_bound(self.to_version)
+            )
+
+    def get_bounds(self) -> RangeBounds:
+        return (
+                self.from_parsed,
+                self.from_inclusive,
+                self.to_parsed,
+                self.to_inclusive
+            )
+
+    def _includes(self, version: Union[PhpVersion, str, bytes]) -> bool:
+        return _includes_parsed(
+                *self.get_bounds(),
+                get_php_version_key(version)
+            )
+
+    def includes(self, version: Union[PhpVersion, str, bytes]) -> bool:
+        return _range_includes(self, version)
+
+
+# The same ranges are typically checked against the same versions many times
+# when scanning multiple sites, so results are cached across lookups
+@lru_cache(maxsize=8192)
+def _range_includes(
+            version_range: VersionRange,
+            version: Union[PhpVersion, str, bytes]
+        ) -> bool:
+    return version_range._includes(version)
+
+
+def compare_range_starts(a: RangeBounds, b: RangeBounds) -> int:
+    a_start = a[0]
+    b_start = b[0]
+    if a_start is None or b_start is None:
+        return (a_start is not None) - (b_start is not None)
+    return compare_php_version_keys(a_start, b_start)
 
 
 class SoftwareType(str, Enum):
@@ -42,18 +122,21 @@ class SoftwareType(str, Enum):
     THEME = 'theme'
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ScannableSoftware:
     type: SoftwareType
     slug: str
     version: bytes
     scan_path: Optional[str]
 
+    def __post_init__(self):
+        self.slug = sys.intern(self.slug)
+
     def get_key(self) -> str:
         return f'{self.type.value}-{self.slug}-{self.version}'
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Software:
     type: SoftwareType
     name: str
@@ -62,21 +145,27 @@ class Software:
     patched: bool = False
     patched_versions: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Many records share the same slugs and names, interning them
+        # reduces memory usage and allows for faster comparisons
+        self.name = sys.intern(self.name)
+        self.slug = sys.intern(self.slug)
+
 
-@dataclass
+@dataclass(**SLOTS)
 class Copyright:
     notice: str
     license: str
     license_url: str
 
 
-@dataclass
+@dataclass(**SLOTS)
 class CopyrightInformation:
     message: Optional[str] = None
     copyrights: Dict[str, Copyright] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Vulnerability:
     identifier: str
     title: str
@@ -107,31 +196,31 @@ class Vulnerability:
                     return software
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ScannerVulnerability(Vulnerability):
     pass
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Cwe:
     identifier: int
     name: str
     description: str
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Cvss:
     vector: str
     score: Union[float, int]
     rating: str
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ProductionSoftware(Software):
     remediation: str = ''
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ProductionVulnerability(Vulnerability):
     software: List[ProductionSoftware] = field(default_factory=list)
     description: str = ''
@@ -145,10 +234,17 @@ class ProductionVulnerability(Vulnerability):
 
 SLUG_WORDPRESS = 'wordpress'
 
+# Most software has no vulnerabilities, so a single immutable empty result is
+# shared rather than allocating a new dictionary for each lookup
+NO_VULNERABILITIES: Mapping[str, Vulnerability] = MappingProxyType({})
+
 
 class VulnerabilityIndex:
 
+    VERSION = 5
+
     def __init__(self, vulnerabilities: Dict[str, Vulnerability]):
+        self.version = self.VERSION
         self.vulnerabilities = vulnerabilities
         self.id_map = {}
         self.cve_map = {}
@@ -158,53 +254,96 @@ class VulnerabilityIndex:
                 self,
                 vulnerability: Vulnerability
             ) -> None:
-        self.id_map[vulnerability.identifier.casefold()] = \
-            vulnerability.identifier
+        identifier = vulnerability.identifier
+        self.id_map[identifier.casefold()] = identifier
         if hasattr(vulnerability, 'cve') and vulnerability.cve is not None:
-            self.cve_map[vulnerability.cve.casefold()] = \
-                vulnerability.identifier
+            self.cve_map[vulnerability.cve.casefold()] = identifier
+        index = self.index
         for software in vulnerability.software:
-            type_index = self.index[software.type]
-            if software.slug not in type_index:
-                type_index[software.slug] = []
-            software_index = type_index[software.slug]
+            append = index[software.type].setdefault(software.slug, []).append
             for version_range in software.affected_versions.values():
-                software_index.append(
-                        (
-                            version_range,
-                            vulnerability.identifier
-                        )
-                    )
+                append((version_range.get_bounds(), identifier))
 
     def _initialize_index(self, vulnerabilities: Dict[str, Vulnerability]):
-        self.index = {}
-        for type in SoftwareType:
-            self.index[type] = {}
+        self.core_index = {}
+        self.plugin_index = {}
+        self.theme_index = {}
+        self.index = {
+                SoftwareType.CORE: self.core_index,
+                SoftwareType.PLUGIN: self.plugin_index,
+                SoftwareType.THEME: self.theme_index
+            }
         for vulnerability in vulnerabilities.values():
             self._add_vulnerability_to_index(vulnerability)
+        # Each slug's ranges are stored as parallel lists of bounds and
+        # identifiers, sorted by lower bound so that lookups can stop at the
+        # first range that starts above the requested version
+        sort_key = cmp_to_key(compare_range_starts)
+        for type_index in self.index.values():
+            for slug, entries in type_index.items():
+                entries.sort(key=lambda entry: sort_key(entry[0]))
+                type_index[slug] = (
+                        [bounds for bounds, _identifier in entries],
+                        [identifier for _bounds, identifier in entries]
+                    )
+
+    def _find_candidate_count(
+                self,
+                ranges: List[RangeBounds],
+                version_key: PhpVersionKey
+            ) -> int:
+        low = 0
+        high = len(ranges)
+        while low < high:
+            middle = (low + high) // 2
+            start = ranges[middle][0]
+            if start is not None \
+                    and compare_php_version_keys(start, version_key) > 0:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _find_vulnerabilities(
+                self,
+                type_index: Dict[str, Tuple[List[RangeBounds], List[str]]],
+                slug: str,
+                version: str
+            ) -> Mapping[str, Vulnerability]:
+        if slug not in type_index:
+            return NO_VULNERABILITIES
+        vulnerabilities = None
+        all_vulnerabilities = self.vulnerabilities
+        ranges, identifiers = type_index[slug]
+        version_key = get_php_version_key(version)
+        count = self._find_candidate_count(ranges, version_key)
+        for bounds, identifier in islice(zip(ranges, identifiers), count):
+            if _includes_parsed(*bounds, version_key):
+                if vulnerabilities is None:
+                    vulnerabilities = {}
+                vulnerabilities[identifier] = all_vulnerabilities[identifier]
+        if vulnerabilities is None:
+            return NO_VULNERABILITIES
+        return vulnerabilities
 
     def get_vulnerabilities(
                 self,
                 software_type: SoftwareType,
                 slug: str,
                 version: str
-            ) -> Dict[str, Vulnerability]:
-        vulnerabilities = {}
-        type_index = self.index[software_type]
-        if slug in type_index:
-            software_index = type_index[slug]
-            for version_range, identifier in software_index:
-                if version_range.includes(version):
-                    vulnerabilities[identifier] = \
-                            self.vulnerabilities[identifier]
-        return vulnerabilities
+            ) -> Mapping[str, Vulnerability]:
+        return self._find_vulnerabilities(
+                self.index[software_type],
+                slug,
+                version
+            )
 
     def get_core_vulnerabilties(
                 self,
                 version: str
-            ) -> Dict[str, Vulnerability]:
-        return self.get_vulnerabilities(
-                SoftwareType.CORE,
+            ) -> Mapping[str, Vulnerability]:
+        return self._find_vulnerabilities(
+                self.core_index,
                 SLUG_WORDPRESS,
                 version
             )
@@ -213,9 +352,9 @@ class VulnerabilityIndex:
                 self,
                 slug: str,
                 version: str
-            ) -> Dict[str, Vulnerability]:
-        return self.get_vulnerabilities(
-                SoftwareType.PLUGIN,
+            ) -> Mapping[str, Vulnerability]:
+        return self._find_vulnerabilities(
+                self.plugin_index,
                 slug,
                 version
             )
@@ -224,13 +363,16 @@ class VulnerabilityIndex:
                 self,
                 slug: str,
                 version: str
-            ) -> Dict[str, Vulnerability]:
-        return self.get_vulnerabilities(
-                SoftwareType.THEME,
+            ) -> Mapping[str, Vulnerability]:
+        return self._find_vulnerabilities(
+                self.theme_index,
                 slug,
                 version
             )
 
+    def is_supported_version(self) -> bool:
+        return hasattr(self, 'version') and self.version == self.VERSION
+
     def includes_vulnerability(self, identifier: str) -> bool:
         casefolded = identifier.casefold()
         return casefolded in self.vulnerabilities or casefolded in self.cve_map
@@ -251,13 +393,23 @@ class VulnerabilityFilter:
                 included: Set[str],
                 informational: bool = False
             ):
-        self.filtered_ids = set(included) | set(excluded)
+        self.filtered_ids = frozenset(included) | frozenset(excluded)
         self.excluded = self._make_case_insensitive(excluded)
         self.included = self._make_case_insensitive(included)
         self.informational = informational
+        self._check_excluded = bool(self.excluded)
+        self._check_included = bool(self.included)
+        self.allows_all = self.informational \
+            and not self._check_excluded \
+            and not self._check_included
 
-    def _make_case_insensitive(self, vulnerability_set: Set[str]) -> Set[str]:
-        return {identifier.casefold() for identifier in vulnerability_set}
+    def _make_case_insensitive(
+                self,
+                vulnerability_set: Set[str]
+            ) -> FrozenSet[str]:
+        return frozenset(
+                identifier.casefold() for identifier in vulnerability_set
+            )
 
     def _contains_vulnerability(
                 self,
@@ -273,19 +425,22 @@ class VulnerabilityFilter:
         return False
 
     def allows(self, vulnerability: Vulnerability) -> bool:
-        if self._contains_vulnerability(self.excluded, vulnerability):
+        if vulnerability.informational and not self.informational:
             return False
-        if len(self.included) and \
-                not self._contains_vulnerability(self.included, vulnerability):
+        if self._check_excluded and \
+                self._contains_vulnerability(self.excluded, vulnerability):
             return False
-        if vulnerability.informational and not self.informational:
+        if self._check_included and \
+                not self._contains_vulnerability(self.included, vulnerability):
             return False
         return True
 
     def filter(
                 self,
-                vulnerabilities: Dict[str, Vulnerability]
-            ) -> Dict[str, Vulnerability]:
+                vulnerabilities: Mapping[str, Vulnerability]
+            ) -> Mapping[str, Vulnerability]:
+        if self.allows_all or not vulnerabilities:
+            return vulnerabilities
         return {
                 identifier: vulnerability for identifier, vulnerability
                 in vulnerabilities.items() if self.allows(vulnerability)
@@ -301,8 +456,8 @@ class VulnerabilityFilter:
 
 
 DEFAULT_FILTER = VulnerabilityFilter(
-        excluded={},
-        included={},
+        excluded=frozenset(),
+        included=frozenset(),
         informational=False
     )
 
@@ -321,14 +476,18 @@ class VulnerabilityScanner:
         self.index = index
         self.filter = filter
         self.vulnerabilities = {}
-        self.affected = {}
+        self.affected = defaultdict(list)
         self.callbacks = []
         self.scan_paths = set()
+        self._scan_cache: Dict[
+                Tuple[SoftwareType, str, bytes],
+                Mapping[str, Vulnerability]
+            ] = {}
 
     def register_result_callback(
                     self,
                     callback: Callable[
-                        [ScannableSoftware, Dict[str, Vulnerability]],
+                        [ScannableSoftware, Mapping[str, Vulnerability]],
                         None
                     ]
                 ) -> None:
@@ -337,7 +496,7 @@ class VulnerabilityScanner:
     def _trigger_callbacks(
                 self,
                 software: ScannableSoftware,
-                vulnerabilities: Dict[str, Vulnerability]
+                vulnerabilities: Mapping[str, Vulnerability]
             ) -> None:
         for callback in self.callbacks:
             callback(software, vulnerabilities)
@@ -348,26 +507,40 @@ class VulnerabilityScanner:
             raise AlreadyScannedException(f'{path} has already been scanned')
         self.scan_paths.add(realpath)
 
-    def scan(self, software: ScannableSoftware) -> Dict[str, Vulnerability]:
+    def _find_vulnerabilities(
+                self,
+                software: ScannableSoftware
+            ) -> Mapping[str, Vulnerability]:
+        # Both the index and filter are fixed for the lifetime of the
+        # scanner, so results can be reused for identical software
+        key = (software.type, software.slug, software.version)
+        vulnerabilities = self._scan_cache.get(key)
+        if vulnerabilities is not None:
+            return vulnerabilities
         vulnerabilities = self.index.get_vulnerabilities(
                 software.type,
                 software.slug,
                 software.version
             )
         vulnerabilities = self.filter.filter(vulnerabilities)
+        self._scan_cache[key] = vulnerabilities
+        return vulnerabilities
+
+    def scan(self, software: ScannableSoftware) -> Mapping[str, Vulnerability]:
+        vulnerabilities = self._find_vulnerabilities(software)
         self._trigger_callbacks(software, vulnerabilities)
-        self.vulnerabilities.update(vulnerabilities)
-        for identifier in vulnerabilities:
-            if identifier not in self.affected:
-                self.affected[identifier] = []
-            self.affected[identifier].append(software)
+        if vulnerabilities:
+            self.vulnerabilities.update(vulnerabilities)
+            affected = self.affected
+            for identifier in vulnerabilities:
+                affected[identifier].append(software)
         return vulnerabilities
 
     def scan_core(
                 self,
                 version: bytes,
                 scan_path: Optional[str]
-            ) -> Dict[str, Vulnerability]:
+            ) -> Mapping[str, Vulnerability]:
         return self.scan(
                 ScannableSoftware(
                     type=SoftwareType.CORE,
@@ -381,7 +554,7 @@ class VulnerabilityScanner:
                 self,
                 site: WordpressSite,
                 scan_path: Optional[str] = None
-            ) -> Dict[str, Vulnerability]:
+            ) -> Mapping[str, Vulnerability]:
         return self.scan_core(site.get_version(), scan_path)
 
     def scan_extension(
@@ -389,7 +562,7 @@ class VulnerabilityScanner:
                 extension: Extension,
                 type: SoftwareType,
                 scan_path: Optional[str] = None
-            ) -> Dict[str, Vulnerability]:
+            ) -> Mapping[str, Vulnerability]:
         return self.scan(
                 ScannableSoftware(
                     type=type,
@@ -403,14 +576,14 @@ class VulnerabilityScanner:
                 self,
                 plugin: Plugin,
                 scan_path: Optional[str] = None
-            ) -> Dict[str, Vulnerability]:
+            ) -> Mapping[str, Vulnerability]:
         return self.scan_extension(plugin, SoftwareType.PLUGIN, scan_path)
 
     def scan_theme(
                 self,
                 theme: Theme,
                 scan_path: Optional[str] = None
-            ) -> Dict[str, Vulnerability]:
+            ) -> Mapping[str, Vulnerability]:
         return self.scan_extension(theme, SoftwareType.THEME, scan_path)
 
     def get_vulnerability_count(self) -> int:
@@ -126,7 +126,13 @@ class CacheDirectory(Cache):
         return pickle.dumps(value)
 
     def _deserialize_value(self, value: Any) -> Any:
-        return limited_deserialize(value, self.allowed)
+        try:
+            return limited_deserialize(value, self.allowed)
+        except pickle.UnpicklingError as e:
+            # Corrupt or truncated entries are treated as missing
+            raise InvalidCachedValueException(
+                    'Failed to deserialize cached value'
+                ) from e
 
     def _get_path(self, key: str) -> bytes:
         return os.path.join(
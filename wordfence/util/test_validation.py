@@ -0,0 +1,136 @@
+import unittest
+
+from .validation import DictionaryValidator, ListValidator, \
+        AllowedValueValidator, OptionalValueValidator, NumberValidator, \
+        ValidationException
+
+
+class TestValidation(unittest.TestCase):
+
+    def _expect_failure(
+                self,
+                validator,
+                data,
+                key: list,
+                message: str
+            ) -> ValidationException:
+        with self.assertRaises(ValidationException) as context:
+            validator.validate(data)
+        exception = context.exception
+        self.assertEqual(exception.key, key)
+        self.assertEqual(exception.message, message)
+        return exception
+
+    def _create_validator(self) -> DictionaryValidator:
+        return DictionaryValidator(
+                {
+                    'name': str,
+                    'count': NumberValidator(),
+                    'tags': ListValidator(str),
+                    'status': AllowedValueValidator({'active', 'inactive'}),
+                    'parent': OptionalValueValidator(str),
+                    'details': DictionaryValidator({
+                        'items': ListValidator({
+                            0: DictionaryValidator({'id': int})
+                        })
+                    })
+                },
+                optional_keys={'parent'}
+            )
+
+    def _create_data(self) -> dict:
+        return {
+                'name': 'example',
+                'count': 1.5,
+                'tags': ['a', 'b'],
+                'status': 'active',
+                'parent': None,
+                'details': {
+                    'items': [{'id': 1}, 'unchecked']
+                }
+            }
+
+    def test_valid(self):
+        validator = self._create_validator()
+        validator.validate(self._create_data())
+        data = self._create_data()
+        del data['parent']
+        validator.validate(data)
+
+    def test_missing_keys(self):
+        validator = self._create_validator()
+        data = self._create_data()
+        del data['name']
+        exception = self._expect_failure(
+                validator,
+                data,
+                ['name'],
+                'Key not present'
+            )
+        self.assertIsNone(exception.value)
+        data = self._create_data()
+        del data['details']['items'][0]['id']
+        self._expect_failure(
+                validator,
+                data,
+                ['details', 'items', 0, 'id'],
+                'Key not present'
+            )
+
+    def test_list_indices(self):
+        validator = self._create_validator()
+        data = self._create_data()
+        data['details']['items'] = []
+        self._expect_failure(
+                validator,
+                data,
+                ['details', 'items', 0],
+                'Index does not exist in list'
+            )
+        data = self._create_data()
+        data['tags'].append(3)
+        exception = self._expect_failure(
+                validator,
+                data,
+                ['tags', 2],
+                "Value must be of type <class 'str'>"
+            )
+        self.assertEqual(exception.value, 3)
+
+    def test_key_strings(self):
+        validator = self._create_validator()
+        data = self._create_data()
+        data['details']['items'][0]['id'] = 'invalid'
+        exception = self._expect_failure(
+                validator,
+                data,
+                ['details', 'items', 0, 'id'],
+                "Value must be of type <class 'int'>"
+            )
+        self.assertEqual(exception.get_key_as_string(), 'details.items.0.id')
+        self.assertEqual(
+                str(exception),
+                "details.items.0.id: Value must be of type <class 'int'>, "
+                "received: 'invalid'"
+            )
+
+    def test_root_number(self):
+        exception = self._expect_failure(
+                NumberValidator(),
+                'invalid',
+                [],
+                "Value is not a valid number: 'invalid'"
+            )
+        self.assertEqual(exception.get_key_as_string(), '')
+
+    def test_add_field(self):
+        validator = DictionaryValidator({'name': str})
+        validator.add_field('count', int)
+        validator.validate({'name': 'example', 'count': 1})
+        with self.assertRaises(ValueError):
+            validator.add_field('tags', list)
+        child = DictionaryValidator({'id': int})
+        parent = DictionaryValidator({'child': child})
+        parent.validate({'child': {'id': 1}})
+        with self.assertRaises(ValueError):
+            child.add_field('name', str)
@@ -1,6 +1,7 @@
 import unittest
 
-from .versioning import compare_php_versions
+from .versioning import compare_php_versions, compare_php_version_keys, \
+        get_php_version_key
 
 
 class TestPhpVersions(unittest.TestCase):
@@ -15,6 +16,13 @@ class TestPhpVersions(unittest.TestCase):
                 compare_php_versions(a, b),
                 expected
             )
+        self.assertEqual(
+                compare_php_version_keys(
+                    get_php_version_key(a),
+                    get_php_version_key(b)
+                ),
+                expected
+            )
 
     def test_numeric(self):
         self._expect_comparison('1.0.0', '1.0.0', 0)
@@ -40,3 +48,10 @@ class TestPhpVersions(unittest.TestCase):
         self._expect_comparison('1.0.0-alpha', '1.0.0-a', 0)
         self._expect_comparison('1.0.0-beta', '1.0.0b', 0)
         self._expect_comparison('1.0.0-pl', '1.0.0-p', 0)
+
+    def test_keys(self):
+        self._expect_comparison('1.0.0-dev', '1', -1)
+        self._expect_comparison('1.0.0.1', '1', 1)
+        self._expect_comparison('1.0.0.0', '1', 0)
+        self._expect_comparison('1.0-foo', '1.0-bar', 0)
+        self._expect_comparison('1.0pl', '1.0.1', 1)
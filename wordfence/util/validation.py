@@ -1,41 +1,102 @@
-from typing import Optional, Any, Set
+from typing import Optional, Any, Set, Callable, Tuple, Union
+
+
+# Keys are tracked as a chain of (parent, key) pairs while validating so
+# that the full path only needs to be built when validation fails
+KeyPath = Optional[Tuple['KeyPath', Any]]
+
+
+def key_path_to_list(key: KeyPath) -> list:
+    components = []
+    while key is not None:
+        key, component = key
+        components.append(component)
+    components.reverse()
+    return components
 
 
 class ValidationException(Exception):
 
-    def __init__(self, key: list, message: str, value=None):
+    __slots__ = ('key', 'message', 'value')
+
+    def __init__(
+                self,
+                key: Union[list, KeyPath],
+                message: str,
+                value=None
+            ):
+        if key is None or isinstance(key, tuple):
+            key = key_path_to_list(key)
         self.key = key
+        self.message = message
         self.value = value
-        super().__init__(
+        super().__init__(key, message, value)
+
+    def __str__(self) -> str:
+        # The message is only formatted when it is actually displayed
+        return (
                 self.get_key_as_string() +
                 ': ' +
-                message +
+                self.message +
                 ', received: ' +
-                repr(value)
+                repr(self.value)
             )
 
     def get_key_as_string(self) -> str:
-        return '.'.join([str(component) for component in self.key])
+        return '.'.join(map(str, self.key))
+
+
+CompiledValidator = Callable[[Any, KeyPath], None]
+
+
+_MISSING = object()
 
 
 class Validator:
 
-    def validate(self, data, parent_key: Optional[list] = None):
-        pass
+    # Validators are compiled into a tree of closures on first use so that
+    # the expected structure is only interpreted once; compiling a validator
+    # also compiles its children, so none of them can be modified afterwards
+    __slots__ = ('_compiled',)
 
-    def validate_type(self, key, value, expected_type) -> None:
-        if isinstance(expected_type, Validator):
-            expected_type.validate(value, key)
-        elif not isinstance(value, expected_type):
-            raise ValidationException(
-                    key,
-                    'Value must be of type ' + str(expected_type),
-                    value
-                )
+    def __init__(self):
+        self._compiled: Optional[CompiledValidator] = None
+
+    def validate(self, data, parent_key: KeyPath = None) -> None:
+        self.compile()(data, parent_key)
+
+    def compile(self) -> CompiledValidator:
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+
+    def _compile(self) -> CompiledValidator:
+        def validate(data, parent_key: KeyPath) -> None:
+            pass
+        return validate
+
+    def is_compiled(self) -> bool:
+        return self._compiled is not None
+
+
+def compile_type(expected_type) -> CompiledValidator:
+    if isinstance(expected_type, Validator):
+        return expected_type.compile()
+    message = 'Value must be of type ' + str(expected_type)
+
+    # The exact type check avoids walking the MRO for the common case,
+    # isinstance is only needed for subclasses
+    def validate(data, parent_key: KeyPath) -> None:
+        if type(data) is not expected_type \
+                and not isinstance(data, expected_type):
+            raise ValidationException(parent_key, message, data)
+    return validate
 
 
 class DictionaryValidator(Validator):
 
+    __slots__ = ('expected', 'validator', 'allow_empty', 'optional_keys')
+
     def __init__(
                 self,
                 expected: Optional[dict] = None,
@@ -43,116 +104,148 @@ class DictionaryValidator(Validator):
                 allow_empty: bool = False,
                 optional_keys: Optional[Set[str]] = None
             ):
+        super().__init__()
         self.expected = expected if expected is not None else dict()
         self.validator = validator
         self.allow_empty = allow_empty
         self.optional_keys = optional_keys if optional_keys is not None else {}
 
-    def _validate_expected_fields(self, data: dict, parent_key: list) -> None:
-        for key, expected_type in self.expected.items():
-            aggregate_key = parent_key + [key]
-            try:
-                value = data[key]
-                self.validate_type(aggregate_key, value, expected_type)
-            except KeyError:
-                if key not in self.optional_keys:
-                    raise ValidationException(aggregate_key, 'Key not present')
-
-    def _validate_all_fields(self, data: dict, parent_key: list) -> None:
-        if self.validator is None:
-            return
-        for key, value in data.items():
-            if key not in self.expected:
-                self.validator.validate(value, parent_key + [key])
-
-    def validate(self, data, parent_key: Optional[list] = None) -> None:
-        if parent_key is None:
-            parent_key = []
-        if not isinstance(data, dict):
-            raise ValidationException(
-                    parent_key,
-                    'Element must be a dictionary',
-                    data
-                )
-        if self.allow_empty and len(data) == 0:
-            return
-        self._validate_expected_fields(data, parent_key)
-        self._validate_all_fields(data, parent_key)
+    def _compile(self) -> CompiledValidator:
+        expected_fields = [
+                (key, key in self.optional_keys, compile_type(expected_type))
+                for key, expected_type in self.expected.items()
+            ]
+        expected_keys = frozenset(self.expected)
+        validate_field = None if self.validator is None \
+            else self.validator.compile()
+        allow_empty = self.allow_empty
+
+        def validate(data, parent_key: KeyPath) -> None:
+            if not isinstance(data, dict):
+                raise ValidationException(
+                        parent_key,
+                        'Element must be a dictionary',
+                        data
+                    )
+            if allow_empty and len(data) == 0:
+                return
+            for key, optional, validate_value in expected_fields:
+                value = data.get(key, _MISSING)
+                if value is _MISSING:
+                    if optional:
+                        continue
+                    raise ValidationException(
+                            (parent_key, key),
+                            'Key not present'
+                        )
+                validate_value(value, (parent_key, key))
+            if validate_field is None:
+                return
+            for key, value in data.items():
+                if key not in expected_keys:
+                    validate_field(value, (parent_key, key))
+        return validate
 
     def add_field(self, key: Any, expected):
+        if self.is_compiled():
+            raise ValueError(
+                    'Fields cannot be added to a validator after it has been '
+                    'compiled'
+                )
         self.expected[key] = expected
 
 
 class ListValidator(Validator):
 
+    __slots__ = ('expected',)
+
     def __init__(self, expected):
+        super().__init__()
         self.expected = expected
 
-    def validate(self, data, parent_key: Optional[list] = None) -> None:
-        if parent_key is None:
-            parent_key = []
-        if not isinstance(data, list):
-            raise ValidationException(
-                    parent_key,
-                    'Element must be a list',
-                    data
-                )
+    def _compile(self) -> CompiledValidator:
         if isinstance(self.expected, dict):
-            for index, expected_type in self.expected.items():
-                key = parent_key + [index]
-                try:
-                    value = data[index]
-                    self.validate_type(key, data[index], expected_type)
-                except IndexError:
+            expected_indices = [
+                    (index, compile_type(expected_type))
+                    for index, expected_type in self.expected.items()
+                ]
+            validate_item = None
+        else:
+            expected_indices = None
+            validate_item = compile_type(self.expected)
+
+        def validate(data, parent_key: KeyPath) -> None:
+            if not isinstance(data, list):
+                raise ValidationException(
+                        parent_key,
+                        'Element must be a list',
+                        data
+                    )
+            if expected_indices is None:
+                for index, value in enumerate(data):
+                    validate_item(value, (parent_key, index))
+                return
+            length = len(data)
+            for index, validate_value in expected_indices:
+                if index >= length:
                     raise ValidationException(
-                            key,
+                            (parent_key, index),
                             'Index does not exist in list'
                         )
-        else:
-            for index, value in enumerate(data):
-                self.validate_type(parent_key + [index], value, self.expected)
+                validate_value(data[index], (parent_key, index))
+        return validate
 
 
 class AllowedValueValidator(Validator):
 
+    __slots__ = ('allowed',)
+
     def __init__(self, allowed: set):
+        super().__init__()
         self.allowed = allowed
 
-    def validate(self, data, parent_key: Optional[list] = None) -> None:
-        for value in self.allowed:
-            if data == value:
-                return
-        raise ValidationException(
-                parent_key,
-                'Value is not in allowed set: ' + repr(data)
-            )
+    def _compile(self) -> CompiledValidator:
+        allowed = tuple(self.allowed)
+
+        def validate(data, parent_key: KeyPath) -> None:
+            for value in allowed:
+                if data == value:
+                    return
+            raise ValidationException(
+                    parent_key,
+                    'Value is not in allowed set: ' + repr(data)
+                )
+        return validate
 
 
 class OptionalValueValidator(Validator):
 
+    __slots__ = ('expected',)
+
     def __init__(self, expected):
+        super().__init__()
         self.expected = expected
 
-    def validate(self, data, parent_key: Optional[list] = None) -> None:
-        if data is None:
-            return
-        if parent_key is None:
-            parent_key = []
-        if isinstance(self.expected, Validator):
-            self.expected.validate(data, parent_key)
-        else:
-            self.validate_type(parent_key, data, self.expected)
+    def _compile(self) -> CompiledValidator:
+        validate_value = compile_type(self.expected)
+
+        def validate(data, parent_key: KeyPath) -> None:
+            if data is None:
+                return
+            validate_value(data, parent_key)
+        return validate
 
 
 class NumberValidator(Validator):
 
-    def __init__(self):
-        pass
-
-    def validate(self, data, parent_key: Optional[list] = None) -> None:
-        if isinstance(data, int) or isinstance(data, float):
-            return
-        raise ValidationException(
-                parent_key,
-                'Value is not a valid number: ' + repr(data)
-            )
+    __slots__ = ()
+
+    def _compile(self) -> CompiledValidator:
+        def validate(data, parent_key: KeyPath) -> None:
+            if isinstance(data, (int, float)):
+                return
+            raise ValidationException(
+                    parent_key,
+                    'Value is not a valid number: ' + repr(data)
+                )
+        return validate
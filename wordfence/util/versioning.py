@@ -1,5 +1,5 @@
 import re
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 
 from .encoding import str_to_bytes, bytes_to_str
 
@@ -92,11 +92,19 @@ class PhpVersionComponent:
             return 1
         return 0
 
+    def get_key(self) -> Tuple[int, int]:
+        # Non-numeric components within the same tier are considered equal
+        return (self.tier, self.value if self.is_number else 0)
+
     def __str__(self) -> str:
         return str(self.value)
 
 
 DefaultComponent = PhpVersionComponent(b'0')
+DEFAULT_COMPONENT_KEY = DefaultComponent.get_key()
+
+
+PhpVersionKey = Tuple[Tuple[int, int], ...]
 
 
 class PhpVersion:
@@ -122,6 +130,9 @@ class PhpVersion:
         except IndexError:
             return DefaultComponent
 
+    def get_key(self) -> PhpVersionKey:
+        return tuple(component.get_key() for component in self._components)
+
 
 def compare_version_components(
             a: Optional[PhpVersionComponent],
@@ -157,6 +168,27 @@ def compare_php_versions(
     return 0
 
 
+def get_php_version_key(
+            version: Union[PhpVersion, str, bytes]
+        ) -> PhpVersionKey:
+    if not isinstance(version, PhpVersion):
+        version = PhpVersion(version)
+    return version.get_key()
+
+
+def compare_php_version_keys(a: PhpVersionKey, b: PhpVersionKey) -> int:
+    """ Equivalent to compare_php_versions for pre-parsed versions """
+    a_length = len(a)
+    b_length = len(b)
+    if a_length < b_length:
+        a += (DEFAULT_COMPONENT_KEY,) * (b_length - a_length)
+    elif b_length < a_length:
+        b += (DEFAULT_COMPONENT_KEY,) * (a_length - b_length)
+    if a == b:
+        return 0
+    return -1 if a < b else 1
+
+
 def version_to_str(version: Optional[bytes]) -> str:
     if version is None:
         return 'unknown'